@@ -5,6 +5,8 @@ import json
 import data_loader as data_loader
 import sir_model as sir_model
 import measles_model
+from contact_index import ContactIndex, InfectionLogStore
+from config import Config
 
 app = FastAPI()
 
@@ -24,6 +26,15 @@ else:
     pos = {}
 print("✅ Layout computed.")
 
+print("🗂️ Building temporal contact index...")
+if data_loader.contacts_df is not None:
+    contact_index = ContactIndex(data_loader.contacts_df, data_loader.communities)
+else:
+    contact_index = None
+print("✅ Contact index built.")
+
+infection_logs = InfectionLogStore()
+
 @app.get("/")
 def read_root():
     return {"status": "Backend is running", "nodes": len(pos)}
@@ -71,8 +82,68 @@ def run_sim(beta: float = 0.2, gamma_days: int = 2, start_nodes: int = 5, incuba
         recovery_days=gamma_days,
         incubation_days=incubation_days
     )
+    if isinstance(results, list) and results:
+        run_id, infection_log = infection_logs.new_log()
+        for step in results:
+            infection_log.record(step)
+        results[0]["run_id"] = run_id
     return results
 
+@app.get("/trace/contacts")
+def trace_contacts(node: int, start: int = None, end: int = None):
+    """
+    Who did a node contact between start and end (inclusive), and for how long.
+    Answered from the per-node temporal index with a binary search.
+    """
+    if contact_index is None:
+        return {"error": "Data not loaded"}
+    if not contact_index.has_node(node):
+        return {"error": f"Unknown node {node}"}
+
+    return {
+        "node": node,
+        "start": start,
+        "end": end,
+        "contacts": contact_index.contacts(node, start, end)
+    }
+
+@app.get("/trace/exposure-tree")
+def trace_exposure_tree(node: int, hops: int = 2, run_id: str = None):
+    """
+    k-hop exposure tree rooted at a node, built from a run's infection log.
+    Defaults to the most recent run (batch or streaming).
+    """
+    if contact_index is None:
+        return {"error": "Data not loaded"}
+    if not contact_index.has_node(node):
+        return {"error": f"Unknown node {node}"}
+
+    run_id = run_id or infection_logs.latest_run_id()
+    infection_log = infection_logs.get(run_id)
+    if infection_log is None:
+        return {"error": "No simulation run found"}
+
+    hops = max(1, min(hops, Config.TRACE_MAX_HOPS))
+    return {
+        "run_id": run_id,
+        "hops": hops,
+        "tree": contact_index.exposure_tree(infection_log, node, hops)
+    }
+
+@app.get("/trace/district-volume")
+def trace_district_volume(start: int = None, end: int = None):
+    """
+    Contact volume per district (community) between start and end (inclusive).
+    """
+    if contact_index is None:
+        return {"error": "Data not loaded"}
+
+    return {
+        "start": start,
+        "end": end,
+        "districts": contact_index.district_volume(start, end)
+    }
+
 @app.websocket("/ws/simulate")
 async def websocket_simulate(websocket: WebSocket):
     """
@@ -93,13 +164,18 @@ async def websocket_simulate(websocket: WebSocket):
         
         print(f"🧪 Starting Streaming Simulation: p={beta}, rec={gamma_days} days, incubation={incubation_days} days")
         
-        for step in sir_model.run_simulation_generator(
+        run_id, infection_log = infection_logs.new_log()
+        
+        for step_index, step in enumerate(sir_model.run_simulation_generator(
             data_loader.contacts_df,
             patient_zero_count=start_nodes,
             transmission_prob=beta,
             recovery_days=gamma_days,
             incubation_days=incubation_days
-        ):
+        )):
+            infection_log.record(step)
+            if step_index == 0:
+                step["run_id"] = run_id
             await websocket.send_json(step)
         
         await websocket.send_json({"done": True})
@@ -137,7 +213,9 @@ async def websocket_simulate_measles(websocket: WebSocket):
         print(f"🦠 Starting Measles Simulation: β={beta}, recovery={gamma_days} days, "
               f"incubation={incubation_days} days, ventilation={ventilation_rate}, mortality={mortality_rate}")
         
-        for step in measles_model.run_measles_simulation_generator(
+        run_id, infection_log = infection_logs.new_log()
+        
+        for step_index, step in enumerate(measles_model.run_measles_simulation_generator(
             data_loader.contacts_df,
             data_loader.communities,
             patient_zero_count=start_nodes,
@@ -148,7 +226,10 @@ async def websocket_simulate_measles(websocket: WebSocket):
             shedding_rate=shedding_rate,
             beta_air=beta_air,
             mortality_rate=mortality_rate
-        ):
+        )):
+            infection_log.record(step)
+            if step_index == 0:
+                step["run_id"] = run_id
             await websocket.send_json(step)
         
         await websocket.send_json({"done": True})
@@ -13,6 +13,10 @@ class Config:
     MEASLES_SHEDDING_RATE = float(os.getenv("MEASLES_SHEDDING_RATE", "10.0"))
     MEASLES_BETA_AIR = float(os.getenv("MEASLES_BETA_AIR", "0.0001"))
     
+    CONTACT_RESOLUTION_SECONDS = int(os.getenv("CONTACT_RESOLUTION_SECONDS", "20"))
+    TRACE_MAX_RUNS = int(os.getenv("TRACE_MAX_RUNS", "10"))
+    TRACE_MAX_HOPS = int(os.getenv("TRACE_MAX_HOPS", "5"))
+    
     @staticmethod
     def get_layout_settings(graph_size):
         if graph_size > Config.NODE_SIZE_THRESHOLD:
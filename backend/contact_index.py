@@ -0,0 +1,231 @@
+import uuid
+from collections import OrderedDict
+import numpy as np
+from config import Config
+
+class ContactIndex:
+    """
+    Per-node temporal adjacency index over the contact timeline (CSR layout).
+    Every contact is stored in both directions; each node's slice is sorted by
+    time, so time windows are answered with a binary search instead of a scan.
+    """
+    def __init__(self, contacts_df, communities=None, resolution=None):
+        self.resolution = resolution if resolution is not None else Config.CONTACT_RESOLUTION_SECONDS
+
+        timestamps = contacts_df['timestamp'].to_numpy(dtype=np.int64)
+        us = contacts_df['u'].to_numpy(dtype=np.int32)
+        vs = contacts_df['v'].to_numpy(dtype=np.int32)
+
+        order = np.argsort(timestamps, kind='stable')
+        self.timestamps = timestamps[order]
+        self.us = us[order]
+        self.vs = vs[order]
+
+        self.num_nodes = int(max(us.max(), vs.max())) + 1 if len(us) else 0
+
+        sources = np.concatenate((self.us, self.vs))
+        targets = np.concatenate((self.vs, self.us))
+        times = np.concatenate((self.timestamps, self.timestamps))
+
+        order = np.lexsort((times, sources))
+        self.neighbors = targets[order]
+        self.times = times[order]
+        self.indptr = np.zeros(self.num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=self.num_nodes), out=self.indptr[1:])
+
+        self.set_communities(communities or {})
+
+    def set_communities(self, communities):
+        self.node_district = np.zeros(self.num_nodes, dtype=np.int32)
+        for node, comm_id in communities.items():
+            if 0 <= node < self.num_nodes:
+                self.node_district[node] = comm_id
+        self.num_districts = int(self.node_district.max()) + 1 if self.num_nodes else 0
+
+    def _window(self, node, start=None, end=None):
+        lo, hi = self.indptr[node], self.indptr[node + 1]
+        times = self.times[lo:hi]
+        left = 0 if start is None else np.searchsorted(times, start, side='left')
+        right = len(times) if end is None else np.searchsorted(times, end, side='right')
+        return self.neighbors[lo + left:lo + right], times[left:right]
+
+    def _summarize(self, neighbors, times):
+        if len(neighbors) == 0:
+            return {}
+
+        ids, first_idx, counts = np.unique(neighbors, return_index=True, return_counts=True)
+        last_idx = len(neighbors) - 1 - np.unique(neighbors[::-1], return_index=True)[1]
+
+        return {
+            int(nbr): {
+                "id": int(nbr),
+                "first_contact": int(times[first]),
+                "last_contact": int(times[last]),
+                "contact_count": int(count),
+                "duration": int(count) * self.resolution
+            }
+            for nbr, first, last, count in zip(ids, first_idx, last_idx, counts)
+        }
+
+    def has_node(self, node):
+        return 0 <= node < self.num_nodes
+
+    def contacts(self, node, start=None, end=None):
+        """
+        Who did `node` contact between start and end (inclusive), and for how long.
+        Duration is the number of contact records times the sampling resolution.
+        """
+        neighbors, times = self._window(node, start, end)
+        summary = self._summarize(neighbors, times)
+        return sorted(summary.values(), key=lambda c: (c["first_contact"], c["id"]))
+
+    def exposure_tree(self, infection_log, root, hops=2):
+        """
+        Builds the k-hop exposure tree rooted at `root` from a run's infection log.
+        A node is a child when its parent contacted it at the exact moment it was
+        exposed, while the parent was infectious.
+        """
+        exposed_at = np.full(self.num_nodes, -1, dtype=np.int64)
+        # Snapshot: a live run may still be appending to the log
+        for node, time in list(infection_log.exposed_time.items()):
+            if 0 <= node < self.num_nodes:
+                exposed_at[node] = time
+
+        tree = infection_log.describe(root)
+        tree["children"] = []
+        visited = {root}
+        frontier = [tree]
+
+        for _ in range(hops):
+            next_frontier = []
+            for entry in frontier:
+                node = entry["id"]
+                start, end = infection_log.infectious_window(node)
+                if start is None:
+                    continue
+
+                # Recoveries are processed before contacts, so the removal second is excluded
+                neighbors, times = self._window(node, start, None if end is None else end - 1)
+                matched = exposed_at[neighbors] == times
+                if not matched.any():
+                    continue
+
+                summary = self._summarize(neighbors, times)
+                for nbr in _ordered_unique(neighbors[matched]):
+                    nbr = int(nbr)
+                    if nbr in visited:
+                        continue
+                    if infection_log.method.get(nbr) == "airborne":
+                        continue
+                    source = infection_log.source.get(nbr)
+                    if source is not None and source != node:
+                        continue
+
+                    visited.add(nbr)
+                    child = infection_log.describe(nbr)
+                    child["contact"] = summary[nbr]
+                    child["children"] = []
+                    entry["children"].append(child)
+                    next_frontier.append(child)
+            frontier = next_frontier
+
+        return tree
+
+    def district_volume(self, start=None, end=None):
+        """
+        Contact volume per district (community) between start and end (inclusive).
+        `contacts` counts contacts involving a member, `internal` those within the district.
+        """
+        lo = 0 if start is None else np.searchsorted(self.timestamps, start, side='left')
+        hi = len(self.timestamps) if end is None else np.searchsorted(self.timestamps, end, side='right')
+
+        district_u = self.node_district[self.us[lo:hi]]
+        district_v = self.node_district[self.vs[lo:hi]]
+        internal_mask = district_u == district_v
+
+        internal = np.bincount(district_u[internal_mask], minlength=self.num_districts)
+        crossing = (np.bincount(district_u[~internal_mask], minlength=self.num_districts) +
+                    np.bincount(district_v[~internal_mask], minlength=self.num_districts))
+        total = internal + crossing
+
+        return {
+            int(district): {
+                "contacts": int(total[district]),
+                "internal": int(internal[district]),
+                "contact_seconds": int(total[district]) * self.resolution
+            }
+            for district in np.flatnonzero(total)
+        }
+
+def _ordered_unique(values):
+    """
+    Unique values in order of first appearance.
+    """
+    _, first_idx = np.unique(values, return_index=True)
+    return values[np.sort(first_idx)]
+
+class InfectionLog:
+    """
+    Per-node infection timeline of a single run, fed step by step from the
+    simulation generators (SEIR and measles step formats).
+    """
+    def __init__(self):
+        self.exposed_time = {}
+        self.infectious_time = {}
+        self.removed_time = {}
+        self.source = {}
+        self.method = {}
+
+    def record(self, step):
+        time = step.get("time")
+        if time is None:
+            return
+
+        for node in step.get("infected", []):
+            self.infectious_time[int(node)] = time
+
+        for infection in step.get("new_infections", []):
+            node = int(infection["id"])
+            self.method[node] = infection.get("method")
+            if infection.get("source") is not None:
+                self.source[node] = int(infection["source"])
+
+        for node in step.get("new_exposed", []):
+            self.exposed_time[int(node)] = time
+        for node in step.get("new_infected", []):
+            self.infectious_time[int(node)] = time
+        for node in step.get("new_recovered", []) + step.get("new_dead", []):
+            self.removed_time[int(node)] = time
+
+    def infectious_window(self, node):
+        return self.infectious_time.get(node), self.removed_time.get(node)
+
+    def describe(self, node):
+        return {
+            "id": int(node),
+            "exposed_at": self.exposed_time.get(node),
+            "infectious_at": self.infectious_time.get(node),
+            "removed_at": self.removed_time.get(node),
+            "source": self.source.get(node)
+        }
+
+class InfectionLogStore:
+    """
+    Keeps the infection logs of the most recent runs, keyed by run_id.
+    """
+    def __init__(self, max_runs=None):
+        self.max_runs = max_runs if max_runs is not None else Config.TRACE_MAX_RUNS
+        self.logs = OrderedDict()
+
+    def new_log(self):
+        run_id = uuid.uuid4().hex[:12]
+        self.logs[run_id] = InfectionLog()
+        while len(self.logs) > self.max_runs:
+            self.logs.popitem(last=False)
+        return run_id, self.logs[run_id]
+
+    def latest_run_id(self):
+        return next(reversed(self.logs), None)
+
+    def get(self, run_id):
+        return self.logs.get(run_id)
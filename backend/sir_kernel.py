@@ -0,0 +1,192 @@
+import random
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """
+        No-op stand-in for numba.njit so the kernel still runs as plain Python.
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+SUSCEPTIBLE = 0
+EXPOSED = 1
+INFECTIOUS = 2
+RECOVERED = 3
+
+EVENT_BECOME_INFECTIOUS = 1
+EVENT_RECOVER = 2
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+@njit(cache=True)
+def _sample_duration(mean_days):
+    std_dev = max(1.0, mean_days * 0.2)
+    sampled_days = max(1.0, np.random.normal(mean_days, std_dev))
+    return sampled_days * SECONDS_PER_DAY
+
+@njit(cache=True)
+def _event_before(heap_times, heap_kinds, heap_nodes, i, j):
+    # Same ordering as heapq on (time, event_type, node) tuples
+    if heap_times[i] != heap_times[j]:
+        return heap_times[i] < heap_times[j]
+    if heap_kinds[i] != heap_kinds[j]:
+        return heap_kinds[i] < heap_kinds[j]
+    return heap_nodes[i] < heap_nodes[j]
+
+@njit(cache=True)
+def _swap(heap_times, heap_kinds, heap_nodes, i, j):
+    heap_times[i], heap_times[j] = heap_times[j], heap_times[i]
+    heap_kinds[i], heap_kinds[j] = heap_kinds[j], heap_kinds[i]
+    heap_nodes[i], heap_nodes[j] = heap_nodes[j], heap_nodes[i]
+
+@njit(cache=True)
+def _heap_push(heap_times, heap_kinds, heap_nodes, size, event_time, event_type, node):
+    i = size
+    heap_times[i] = event_time
+    heap_kinds[i] = event_type
+    heap_nodes[i] = node
+    while i > 0:
+        parent = (i - 1) >> 1
+        if not _event_before(heap_times, heap_kinds, heap_nodes, i, parent):
+            break
+        _swap(heap_times, heap_kinds, heap_nodes, i, parent)
+        i = parent
+    return size + 1
+
+@njit(cache=True)
+def _heap_pop(heap_times, heap_kinds, heap_nodes, size):
+    event_type = heap_kinds[0]
+    node = heap_nodes[0]
+    size -= 1
+    heap_times[0] = heap_times[size]
+    heap_kinds[0] = heap_kinds[size]
+    heap_nodes[0] = heap_nodes[size]
+    i = 0
+    while True:
+        smallest = i
+        left = 2 * i + 1
+        right = left + 1
+        if left < size and _event_before(heap_times, heap_kinds, heap_nodes, left, smallest):
+            smallest = left
+        if right < size and _event_before(heap_times, heap_kinds, heap_nodes, right, smallest):
+            smallest = right
+        if smallest == i:
+            break
+        _swap(heap_times, heap_kinds, heap_nodes, i, smallest)
+        i = smallest
+    return event_type, node, size
+
+@njit(cache=True)
+def _seir_kernel(timestamps, us, vs, status, initial_infected, transmission_prob,
+                 recovery_days, incubation_days, seed):
+    np.random.seed(seed)
+
+    n_nodes = status.shape[0]
+    n_contacts = timestamps.shape[0]
+
+    # A node has at most one pending event, and at most three transitions (E, I, R)
+    heap_times = np.empty(n_nodes, dtype=np.float64)
+    heap_kinds = np.empty(n_nodes, dtype=np.int8)
+    heap_nodes = np.empty(n_nodes, dtype=np.int32)
+    size = 0
+
+    out_times = np.empty(3 * n_nodes, dtype=np.int64)
+    out_nodes = np.empty(3 * n_nodes, dtype=np.int32)
+    out_states = np.empty(3 * n_nodes, dtype=np.int8)
+    count = 0
+
+    start_time = timestamps[0]
+    for k in range(initial_infected.shape[0]):
+        node = initial_infected[k]
+        status[node] = INFECTIOUS
+        size = _heap_push(heap_times, heap_kinds, heap_nodes, size,
+                          start_time + _sample_duration(recovery_days), EVENT_RECOVER, node)
+
+    i = 0
+    while i < n_contacts:
+        timestamp = timestamps[i]
+
+        while size > 0 and heap_times[0] <= timestamp:
+            event_type, node, size = _heap_pop(heap_times, heap_kinds, heap_nodes, size)
+
+            if event_type == EVENT_BECOME_INFECTIOUS:
+                if status[node] == EXPOSED:
+                    status[node] = INFECTIOUS
+                    out_times[count] = timestamp
+                    out_nodes[count] = node
+                    out_states[count] = INFECTIOUS
+                    count += 1
+                    size = _heap_push(heap_times, heap_kinds, heap_nodes, size,
+                                      timestamp + _sample_duration(recovery_days), EVENT_RECOVER, node)
+
+            elif event_type == EVENT_RECOVER:
+                if status[node] == INFECTIOUS:
+                    status[node] = RECOVERED
+                    out_times[count] = timestamp
+                    out_nodes[count] = node
+                    out_states[count] = RECOVERED
+                    count += 1
+
+        while i < n_contacts and timestamps[i] == timestamp:
+            u = us[i]
+            v = vs[i]
+            i += 1
+
+            stat_u = status[u]
+            stat_v = status[v]
+
+            target = -1
+            if stat_u == INFECTIOUS and stat_v == SUSCEPTIBLE:
+                if np.random.random() < transmission_prob:
+                    target = v
+            elif stat_v == INFECTIOUS and stat_u == SUSCEPTIBLE:
+                if np.random.random() < transmission_prob:
+                    target = u
+
+            if target >= 0:
+                status[target] = EXPOSED
+                out_times[count] = timestamp
+                out_nodes[count] = target
+                out_states[count] = EXPOSED
+                count += 1
+                size = _heap_push(heap_times, heap_kinds, heap_nodes, size,
+                                  timestamp + _sample_duration(incubation_days), EVENT_BECOME_INFECTIOUS, target)
+
+    return out_times[:count], out_nodes[:count], out_states[:count]
+
+def run_seir_kernel(timestamps, us, vs, initial_infected, transmission_prob=0.1,
+                    recovery_days=2, incubation_days=3, seed=None):
+    """
+    Runs the whole SEIR event loop over flat contact arrays.
+    Contacts must be sorted by timestamp; node IDs must be non-negative ints.
+    Returns the transitions as flat arrays (time, node, new_state), in the
+    order the generator would have emitted them.
+    """
+    timestamps = np.ascontiguousarray(timestamps, dtype=np.int64)
+    us = np.ascontiguousarray(us, dtype=np.int32)
+    vs = np.ascontiguousarray(vs, dtype=np.int32)
+    initial_infected = np.asarray(initial_infected, dtype=np.int32)
+
+    if len(timestamps) == 0:
+        return (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int8))
+
+    if seed is None:
+        seed = random.getrandbits(32)
+
+    n_nodes = int(max(us.max(), vs.max(), initial_infected.max(initial=-1))) + 1
+    status = np.full(n_nodes, SUSCEPTIBLE, dtype=np.int8)
+
+    return _seir_kernel(
+        timestamps, us, vs, status, initial_infected,
+        float(transmission_prob), float(recovery_days), float(incubation_days), seed
+    )
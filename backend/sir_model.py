@@ -2,6 +2,7 @@ import heapq
 import random
 import pandas as pd
 import numpy as np
+import sir_kernel
 
 SUSCEPTIBLE = 0
 EXPOSED = 1
@@ -15,9 +16,11 @@ def run_simulation(contacts_df, patient_zero_count=5, transmission_prob=0.1, rec
     """
     Runs an Event-Driven SEIR Simulation on the temporal data.
     Returns complete history list for backward compatibility.
+    Uses the compiled whole-run kernel when Numba is installed.
     """
+    generator = run_simulation_compiled_generator if sir_kernel.NUMBA_AVAILABLE else run_simulation_generator
     history = []
-    for step in run_simulation_generator(contacts_df, patient_zero_count, transmission_prob, recovery_days, incubation_days):
+    for step in generator(contacts_df, patient_zero_count, transmission_prob, recovery_days, incubation_days):
         if "error" in step:
             return step
         history.append(step)
@@ -135,4 +138,82 @@ def run_simulation_generator(contacts_df, patient_zero_count=5, transmission_pro
                 "total_exposed": len(current_exposed_ids),
                 "total_infected": len(current_infected_ids),
                 "total_recovered": len(current_recovered_ids)
-            }
\ No newline at end of file
+            }
+
+def contact_arrays(contacts_df):
+    """
+    Flattens the contact timeline into (timestamps, u, v) arrays sorted by time.
+    """
+    if not contacts_df['timestamp'].is_monotonic_increasing:
+        contacts_df = contacts_df.sort_values('timestamp', kind='stable')
+
+    timestamps = contacts_df['timestamp'].to_numpy(dtype=np.int64)
+    us = contacts_df['u'].to_numpy(dtype=np.int32)
+    vs = contacts_df['v'].to_numpy(dtype=np.int32)
+    return timestamps, us, vs
+
+def steps_from_transitions(start_time, initial_infected, times, nodes, states):
+    """
+    Rebuilds the generator's step dicts from the kernel's flat transition arrays.
+    """
+    yield {
+        "time": int(start_time),
+        "infected": list(initial_infected),
+        "exposed": [],
+        "recovered": []
+    }
+
+    total_exposed = 0
+    total_infected = len(initial_infected)
+    total_recovered = 0
+
+    if len(times) == 0:
+        return
+
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(times)) + 1))
+    ends = np.append(starts[1:], len(times))
+
+    for start, end in zip(starts, ends):
+        step_nodes = nodes[start:end]
+        step_states = states[start:end]
+
+        newly_exposed = step_nodes[step_states == EXPOSED].tolist()
+        newly_infected = step_nodes[step_states == INFECTIOUS].tolist()
+        newly_recovered = step_nodes[step_states == RECOVERED].tolist()
+
+        total_exposed += len(newly_exposed) - len(newly_infected)
+        total_infected += len(newly_infected) - len(newly_recovered)
+        total_recovered += len(newly_recovered)
+
+        yield {
+            "time": int(times[start]),
+            "new_exposed": newly_exposed,
+            "new_infected": newly_infected,
+            "new_recovered": newly_recovered,
+            "total_exposed": total_exposed,
+            "total_infected": total_infected,
+            "total_recovered": total_recovered
+        }
+
+def run_simulation_compiled_generator(contacts_df, patient_zero_count=5, transmission_prob=0.1, recovery_days=2, incubation_days=3):
+    """
+    Same SEIR model and step format as run_simulation_generator, but the whole
+    event loop runs up front in sir_kernel over int32 contact arrays.
+    """
+    if contacts_df is None:
+        yield {"error": "Data not loaded"}
+        return
+
+    unique_nodes = pd.unique(contacts_df[['u', 'v']].values.ravel('K'))
+    initial_sample = random.sample(list(unique_nodes), patient_zero_count)
+    initial_infected = [int(node) for node in initial_sample]
+
+    timestamps, us, vs = contact_arrays(contacts_df)
+    times, nodes, states = sir_kernel.run_seir_kernel(
+        timestamps, us, vs, initial_infected,
+        transmission_prob=transmission_prob,
+        recovery_days=recovery_days,
+        incubation_days=incubation_days
+    )
+
+    yield from steps_from_transitions(timestamps[0], initial_infected, times, nodes, states)